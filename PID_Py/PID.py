@@ -1,7 +1,13 @@
-import time
+from time import perf_counter as _perfCounter
+import math
+from array import array
 from enum import Flag, auto
-from threading import Thread
+from threading import Thread, Event
+from queue import Queue
+from struct import Struct
 import logging
+import asyncio
+import atexit
 from PID_Py.Simulation import Simulation
 
 class HistorianParams(Flag):
@@ -18,6 +24,131 @@ class HistorianParams(Flag):
     PROCESS_VALUE = auto()
     ERROR = auto()
 
+# Historian names, in the record order
+_historianNames = ("P", "I", "D", "OUTPUT", "SETPOINT", "PROCESS_VALUE", "ERROR", "TIME")
+
+# Full historian record (all values), stored with one call
+_historianRecord = Struct("8d")
+
+# Running historian file writers (queue -> thread), stopped by `PID.closeHistorianFile` or at the interpreter exit
+_historianWriters = {}
+
+def _historianWriter(path: str, chunks: Queue) -> None:
+    """
+    Append historian chunks (list of bytes, one per recorded value) to `path`, until a `None` chunk is received. Executed in a daemon thread.
+    """
+    while True:
+        chunk = chunks.get()
+
+        if chunk is None:
+            break
+
+        with open(path, "ab") as file:
+            for data in chunk:
+                file.write(data)
+
+def _historianWriterStop(chunks: Queue) -> None:
+    """
+    Wait until the queued chunks are written, then stop the writer thread.
+    """
+    writer = _historianWriters.pop(chunks, None)
+
+    if writer is not None:
+        chunks.put(None)
+        writer.join()
+
+@atexit.register
+def _historianWritersStop() -> None:
+    """
+    Write the queued chunks of all running writers before the interpreter exit (daemon threads are killed after).
+    """
+    for chunks in list(_historianWriters):
+        _historianWriterStop(chunks)
+
+def _nextDeadline(referenceTime: float, cycles: int, cycleTime: float) -> tuple[int, float]:
+    """
+    Next cycle of a periodic execution. Deadlines are computed from the reference time (no drift by accumulation).
+    When the execution is late more than one cycle, the missed cycles are dropped.
+
+    Returns
+    -------
+    tuple[int, float]
+        Cycle number since the reference time and its deadline
+    """
+    cycles += 1
+    nextTime = referenceTime + cycles * cycleTime
+    lateTime = _perfCounter() - nextTime
+
+    if (lateTime > cycleTime):
+        cycles += int(lateTime // cycleTime)
+        nextTime = referenceTime + cycles * cycleTime
+    
+    return cycles, nextTime
+
+def _pidStep(error: float, lastError: float, processValue: float, lastProcessValue: float, integral: float, deltaTime: float, kp: float, ki: float, kd: float, integrate: bool, proportionnalOnMeasurement: bool, derivativeOnMeasurement: bool, integralMin: float, integralMax: float) -> tuple[float, float, float, bool]:
+    """
+    PID calculation of one cycle, on scalars only.
+    Disabled limits are passed as -inf/+inf instead of None.
+
+    Parameters
+    ----------
+    error: float
+        Current error
+
+    lastError: float
+        Error of the previous cycle
+
+    processValue: float
+        Current process value
+
+    lastProcessValue: float
+        Process value of the previous cycle
+
+    integral: float
+        Integral part of the previous cycle
+
+    deltaTime: float
+        Time since the previous cycle (second)
+
+    kp, ki, kd: float
+        PID gains
+
+    integrate: bool
+        Update the integral part (False in manual mode, integral freezing or deadband)
+
+    proportionnalOnMeasurement, derivativeOnMeasurement: bool
+        Same as `PID` parameters
+
+    integralMin, integralMax: float
+        Integral part limits
+
+    Returns
+    -------
+    tuple[float, float, float, bool]
+        Proportionnal part, integral part, derivative part and integral limit reached
+    """
+    # ===== Proportionnal part =====
+    if (not proportionnalOnMeasurement):
+        p = error * kp
+    else:
+        p = -processValue * kp
+
+    # ===== Integral part =====
+    if (integrate):
+        integral += ((error + lastError) / 2.0) * deltaTime * ki
+
+    # Integral part limitation (comparisons are False for NaN, not considered as a reached limit)
+    integralLimitReached = integral > integralMax or integral < integralMin
+    limitedIntegral = integralMax if integral > integralMax else (integralMin if integral < integralMin else integral)
+
+    # ===== Derivative part =====
+    if (not derivativeOnMeasurement):
+        d = ((error - lastError) / deltaTime) * kd
+    else:
+        d = -((processValue - lastProcessValue) / deltaTime) * kd
+
+    return p, limitedIntegral, d, integralLimitReached
+
 class PID:
     """
     PID controller base class.
@@ -105,6 +236,11 @@ class PID:
     simulation: Simulation, default = None
         Pass a simulation object to activate simulation.
     
+    historianFile: str, default = None
+        File where the historian is saved each time `historianLenght` values are recorded, to keep all values of a long run.
+        Values are raw float64, for each saved block : `historianLenght` values of each recorded value (same order as `historian`).
+        The file is overwritten at initialization. Ignored if the historian isn't configured.
+    
     Attributes
     ----------
     kp: float
@@ -155,11 +291,14 @@ class PID:
         Same as `historianParams` in parameters section
     
     historian: dict[str, list]
-        PID value recorded
+        PID value recorded (read-only copy). Values are stored in preallocated ring buffers of `historianLenght` values, the oldest ones are overwritten first.
     
     historianLenght: int
         Same as `historianLenght` in parameters section.
     
+    historianFile: str
+        Same as `historianFile` in parameters section.
+    
     output: float
         PID output
     
@@ -190,8 +329,23 @@ class PID:
 
     __call__(processValue, setpoint)
         call `compute`. Is a code simplification.
+
+    computeBatch(setpoints, processValues, times)
+        Execute PID calculation over recorded samples, without modifying the PID. Return outputs.
     """
-    def __init__(self, kp: float, ki: float, kd: float, indirectAction: bool = False, proportionnalOnMeasurement: bool = False, integralLimit: float = None, derivativeOnMeasurement: bool = False, setpointRamp: float = None, setpointStableLimit: float = None, setpointStableTime: float = 1.0, deadband: float = None, deadbandActivationTime: float = 1.0, processValueStableLimit: float = None, processValueStableTime: float = 1.0, historianParams: HistorianParams = None, historianLenght: int = 100000, outputLimits: tuple[float, float] = (None, None), logger: logging.Logger = None, simulation: Simulation = None) -> None:
+    # Fixed attributes layout, smaller instances and faster attribute access than a `__dict__`
+    __slots__ = ("kp", "ki", "kd", "indirectAction", "proportionnalOnMeasurement", "_integralLimit", "_integralMin", "_integralMax", "derivativeOnMeasurement",
+                 "setpointRamp", "setpointStableLimit", "setpointStableTime", "deadband", "deadbandActivationTime", "processValueStableLimit", "processValueStableTime",
+                 "_outputLimits", "_outputMin", "_outputMax", "integralFreezing", "_manualMode", "manualValue", "bumplessSwitching",
+                 "historianParams", "historianLenght", "historianFile", "_historianBuffers", "_historianCount", "_historianQueue",
+                 "_logP", "_logI", "_logD", "_logOutput", "_logSetpoint", "_logProcessValue", "_logError", "_logAny", "_logAll", "_historianRecords",
+                 "_histP", "_histI", "_histD", "_histOutput", "_histSetpoint", "_histProcessValue", "_histError", "_histTime",
+                 "_lastTime", "_lastError", "_lastProcessValue", "_startTime", "_processValueCurrStableTime", "_setpointValueCurrStableTime", "_deadbandTime",
+                 "_p", "_i", "_d", "_setpoint", "_setuptoolControl", "_setuptoolSetpoint",
+                 "output", "processValueStabilized", "setpointReached", "logger",
+                 "integralLimitReached", "memIntegralLimitReached", "outputLimitsReached", "memoutputLimitsReached", "simulation", "__weakref__")
+
+    def __init__(self, kp: float, ki: float, kd: float, indirectAction: bool = False, proportionnalOnMeasurement: bool = False, integralLimit: float = None, derivativeOnMeasurement: bool = False, setpointRamp: float = None, setpointStableLimit: float = None, setpointStableTime: float = 1.0, deadband: float = None, deadbandActivationTime: float = 1.0, processValueStableLimit: float = None, processValueStableTime: float = 1.0, historianParams: HistorianParams = None, historianLenght: int = 100000, outputLimits: tuple[float, float] = (None, None), logger: logging.Logger = None, simulation: Simulation = None, historianFile: str = None) -> None:
         # PID parameters
         self.kp = kp
         self.ki = ki
@@ -219,45 +373,70 @@ class PID:
         self.integralFreezing = False
 
         # Manual mode
-        self.manualMode = False
+        self._manualMode = False
         self.manualValue = 0.0
         self.bumplessSwitching = True
 
         # Historian setup
         self.historianParams = historianParams
-        self.historian = {}
 
         if (historianLenght <= 0):
             raise ValueError("`historianLenght` can't be 0 or negative!")
 
         self.historianLenght = historianLenght
         
-        if self.historianParams is not None:
-            if HistorianParams.P in self.historianParams:
-                self.historian["P"] = []
-            
-            if HistorianParams.I in self.historianParams:
-                self.historian["I"] = []
-
-            if HistorianParams.D in self.historianParams:
-                self.historian["D"] = []
-            
-            if HistorianParams.OUTPUT in self.historianParams:
-                self.historian["OUTPUT"] = []
-            
-            if HistorianParams.SETPOINT in self.historianParams:
-                self.historian["SETPOINT"] = []
-            
-            if HistorianParams.PROCESS_VALUE in self.historianParams:
-                self.historian["PROCESS_VALUE"] = []
-
-            if HistorianParams.ERROR in self.historianParams:
-                self.historian["ERROR"] = []
-
-            if (HistorianParams.P in self.historianParams) or (HistorianParams.I in self.historianParams) or (HistorianParams.D in self.historianParams) or (HistorianParams.ERROR in self.historianParams) or (HistorianParams.OUTPUT in self.historianParams) or (HistorianParams.PROCESS_VALUE in self.historianParams) or (HistorianParams.SETPOINT in self.historianParams):
-                self.historian["TIME"] = []
-        else:
-            self.historian = None
+        # Recorded values, resolved once to avoid flag tests on each cycle
+        params = self.historianParams or HistorianParams(0)
+
+        self._logP = HistorianParams.P in params
+        self._logI = HistorianParams.I in params
+        self._logD = HistorianParams.D in params
+        self._logOutput = HistorianParams.OUTPUT in params
+        self._logSetpoint = HistorianParams.SETPOINT in params
+        self._logProcessValue = HistorianParams.PROCESS_VALUE in params
+        self._logError = HistorianParams.ERROR in params
+        self._logAny = bool(params)
+        self._logAll = self._logP and self._logI and self._logD and self._logOutput and self._logSetpoint and self._logProcessValue and self._logError
+
+        # Nothing is allocated when no value is recorded, `compute` skips the historian with `_logAny`
+        self._historianBuffers = None if self.historianParams is None else {}
+        self._historianRecords = None
+
+        if self._logAll:
+            # All values recorded, one buffer of records (one record per cycle) written with a single call
+            self._historianRecords = array("d", [0.0]) * (len(_historianNames) * self.historianLenght)
+        elif self._logAny:
+            for name, recorded in zip(_historianNames, (self._logP, self._logI, self._logD, self._logOutput, self._logSetpoint, self._logProcessValue, self._logError, True)):
+                if recorded:
+                    self._historianBuffers[name] = array("d", [0.0]) * self.historianLenght
+
+        # Ring buffers (None when not recorded), to avoid dict lookups on each cycle
+        historian = self._historianBuffers or {}
+
+        self._histP = historian.get("P")
+        self._histI = historian.get("I")
+        self._histD = historian.get("D")
+        self._histOutput = historian.get("OUTPUT")
+        self._histSetpoint = historian.get("SETPOINT")
+        self._histProcessValue = historian.get("PROCESS_VALUE")
+        self._histError = historian.get("ERROR")
+        self._histTime = historian.get("TIME")
+
+        # Number of cycles recorded since the start, the next write position is `_historianCount % historianLenght`
+        self._historianCount = 0
+
+        # Full buffers are copied to a queue, the file is written by a background thread to keep disk access out of `compute`
+        self.historianFile = historianFile
+        self._historianQueue = None
+
+        if (self.historianFile is not None and self._logAny):
+            open(self.historianFile, "wb").close()
+
+            self._historianQueue = Queue()
+
+            writer = Thread(target=_historianWriter, args=(self.historianFile, self._historianQueue), daemon=True)
+            _historianWriters[self._historianQueue] = writer
+            writer.start()
         
         # Internal attributes
         self._lastTime = None
@@ -292,7 +471,6 @@ class PID:
             self.logger = logging.getLogger(logger)
             self.logger.info("PID object created")
 
-        self.memManualMode = False
         self.integralLimitReached = False
         self.memIntegralLimitReached = False
         self.outputLimitsReached = False
@@ -301,6 +479,95 @@ class PID:
         # Simulation
         self.simulation = simulation
 
+    @property
+    def historian(self) -> dict[str, list[float]]:
+        """
+        Recorded values, in chronological order. None if the historian isn't configured.
+        Each access returns a copy of the ring buffers, read it once and keep the result.
+        """
+        return self._historianLast(self.historianLenght)
+
+    def _historianLast(self, count: int, total: int = None) -> dict[str, list[float]]:
+        """
+        Copy of the last `count` records (at most the recorded ones), in chronological order. None if the historian isn't configured.
+        `total` is the number of records to consider (`_historianCount` read before, when the PID runs in another thread).
+        """
+        if self._historianBuffers is None:
+            return None
+        
+        if total is None:
+            total = self._historianCount
+
+        historianLenght = self.historianLenght
+        count = min(count, total, historianLenght)
+
+        # Position of the oldest requested record, records after the buffer end continue at the beginning
+        start = (total - count) % historianLenght
+        stop = start + count
+
+        if self._historianRecords is None:
+            if stop <= historianLenght:
+                return {k: v[start:stop].tolist() for k, v in self._historianBuffers.items()}
+            
+            return {k: v[start:].tolist() + v[:stop - historianLenght].tolist() for k, v in self._historianBuffers.items()}
+        
+        recordSize = len(_historianNames)
+
+        if stop <= historianLenght:
+            records = self._historianRecords[start * recordSize:stop * recordSize]
+        else:
+            records = self._historianRecords[start * recordSize:] + self._historianRecords[:(stop - historianLenght) * recordSize]
+        
+        return {name: records[k::recordSize].tolist() for k, name in enumerate(_historianNames)}
+
+    def _historianColumns(self) -> dict[str, array]:
+        """
+        Ring buffer of each recorded value. When all values are recorded, the columns are extracted (copied) from the records buffer.
+        """
+        if self._historianRecords is None:
+            return self._historianBuffers
+        
+        return {name: self._historianRecords[k::len(_historianNames)] for k, name in enumerate(_historianNames)}
+
+    @property
+    def manualMode(self) -> bool:
+        return self._manualMode
+
+    @manualMode.setter
+    def manualMode(self, value: bool) -> None:
+        # Mode switching is logged when it happens, instead of being detected on each calculation
+        if (value and not self._manualMode and isinstance(self.logger, logging.Logger)):
+            self.logger.info("PID switched to manual mode")
+        elif (not value and self._manualMode and isinstance(self.logger, logging.Logger)):
+            self.logger.info("PID switched to automatic mode")
+
+        self._manualMode = value
+
+    @property
+    def integralLimit(self) -> float:
+        return self._integralLimit
+
+    @integralLimit.setter
+    def integralLimit(self, value: float) -> None:
+        self._integralLimit = value
+
+        # Disabled limit as infinite bounds, so the calculation doesn't test None on each cycle
+        self._integralMin = -math.inf if value is None else -value
+        self._integralMax = math.inf if value is None else value
+
+    @property
+    def outputLimits(self) -> tuple[float, float]:
+        return self._outputLimits
+
+    @outputLimits.setter
+    def outputLimits(self, value: tuple[float, float]) -> None:
+        self._outputLimits = value
+
+        # Disabled limits as infinite bounds, so the calculation doesn't test None on each cycle
+        low, high = (None, None) if value is None else value
+        self._outputMin = -math.inf if low is None else low
+        self._outputMax = math.inf if high is None else high
+
     def compute(self, setpoint: float, processValue: float = None, currentTime: float = None) -> float:
         """
         PID calculation execution
@@ -315,8 +582,8 @@ class PID:
             Leave it to `None` when the simulation is used.
 
         currentTime: float, default = None
-            The current time. For simulation purpose only.
-            Leave it to `None` for a real application.
+            The current time (second). For simulation purpose only.
+            Leave it to `None` for a real application, the monotonic performance counter (`time.perf_counter`) is used.
         
         Returns
         -------
@@ -327,118 +594,111 @@ class PID:
         if processValue is None:
             processValue = self.simulation.output
         
-        # Logging mode switching
-        if (self.manualMode and not self.memManualMode and isinstance(self.logger, logging.Logger)):
-            self.logger.info("PID switched to manual mode")
-        elif (not self.manualMode and self.memManualMode and isinstance(self.logger, logging.Logger)):
-            self.logger.info("PID switched to automatic mode")
-        
-        self.memManualMode = self.manualMode
-        
+        # Attributes used several times are read once
+        manualMode = self._manualMode
+        logger = self.logger
+
         if (currentTime is None):
-            actualTime = time.time()
+            actualTime = _perfCounter()
         else:
             actualTime = currentTime
         
         # PID calculation
-        if self._startTime is not None and self._lastTime is not None:
+        lastTime = self._lastTime
+
+        if self._startTime is not None and lastTime is not None:
+            lastError = self._lastError
+            lastProcessValue = self._lastProcessValue
+
             # ===== Delta time =====
-            deltaTime = actualTime - self._lastTime
+            deltaTime = actualTime - lastTime
+
+            # Same time as the previous execution (or earlier), nothing to compute
+            if (deltaTime <= 0.0):
+                return self.output
 
             # Process value stabilization
-            if (self.processValueStableLimit is not None):
-                if (abs((processValue - self._lastProcessValue) / deltaTime) < self.processValueStableLimit):
-                    self._processValueCurrStableTime += deltaTime
+            processValueStableLimit = self.processValueStableLimit
+
+            if (processValueStableLimit is not None):
+                if (abs((processValue - lastProcessValue) / deltaTime) < processValueStableLimit):
+                    processValueCurrStableTime = self._processValueCurrStableTime + deltaTime
                 else:
-                    self._processValueCurrStableTime = 0.0
+                    processValueCurrStableTime = 0.0
 
-                self.processValueStabilized = self._processValueCurrStableTime > self.processValueStableTime
+                self._processValueCurrStableTime = processValueCurrStableTime
+                self.processValueStabilized = processValueCurrStableTime > self.processValueStableTime
             else:
                 self.processValueStabilized = False
                 self._processValueCurrStableTime = 0.0
 
             # ===== Setpoint ramp =====
+            currentSetpoint = self._setpoint
+
             if not self._setuptoolControl:
-                setpointDiff = setpoint - self._setpoint
+                setpointDiff = setpoint - currentSetpoint
                 self._setuptoolSetpoint = setpoint
             else:
-                setpointDiff = self._setuptoolSetpoint - self._setpoint
-
-            if (self.setpointRamp is not None):
-                if (self.setpointRamp > 0.0):
-                    if (setpointDiff > self.setpointRamp * deltaTime):
-                        setpointDiff = self.setpointRamp * deltaTime
-                    elif (setpointDiff < -self.setpointRamp * deltaTime):
-                        setpointDiff = -self.setpointRamp * deltaTime
+                setpointDiff = self._setuptoolSetpoint - currentSetpoint
+
+            setpointRamp = self.setpointRamp
+
+            if (setpointRamp is not None and setpointRamp > 0.0):
+                maxSetpointDiff = setpointRamp * deltaTime
+                setpointDiff = maxSetpointDiff if setpointDiff > maxSetpointDiff else (-maxSetpointDiff if setpointDiff < -maxSetpointDiff else setpointDiff)
                 
-            self._setpoint += setpointDiff
+            currentSetpoint += setpointDiff
+            self._setpoint = currentSetpoint
 
             # ===== Error calculation =====
             if self.indirectAction:
-                error = processValue - self._setpoint
+                error = processValue - currentSetpoint
             else:
-                error = self._setpoint - processValue
+                error = currentSetpoint - processValue
 
             # ===== Setpoint reached =====
-            if (self.setpointStableLimit is not None):
-                if abs(error) < self.setpointStableLimit:
-                    self._setpointValueCurrStableTime += deltaTime
+            setpointStableLimit = self.setpointStableLimit
+
+            if (setpointStableLimit is not None):
+                if abs(error) < setpointStableLimit:
+                    setpointValueCurrStableTime = self._setpointValueCurrStableTime + deltaTime
                 else:
-                    self._setpointValueCurrStableTime = 0.0
+                    setpointValueCurrStableTime = 0.0
                 
-                self.setpointReached = self._setpointValueCurrStableTime > self.setpointStableTime
+                self._setpointValueCurrStableTime = setpointValueCurrStableTime
+                self.setpointReached = setpointValueCurrStableTime > self.setpointStableTime
             else:
                 self._setpointValueCurrStableTime = 0.0
                 self.setpointReached = False
             
-            # ===== Proportionnal part =====
-            if (not self.proportionnalOnMeasurement):
-                self._p = error * self.kp
-            else:
-                self._p = -processValue * self.kp
-
             # ===== Deadband =====
-            if (self.deadband is not None):
-                if (abs(error) < self.deadband):
-                    self._deadbandTime += deltaTime
+            deadband = self.deadband
+
+            if (deadband is not None):
+                if (abs(error) < deadband):
+                    deadbandTime = self._deadbandTime + deltaTime
                 else:
-                    self._deadbandTime = 0.0
+                    deadbandTime = 0.0
             else:
-                self._deadbandTime = 0.0
+                deadbandTime = 0.0
 
-            # ===== Integral part =====
-            if (not self.manualMode and not self.integralFreezing and (self._deadbandTime < self.deadbandActivationTime)):
-                self._i += ((error + self._lastError) / 2.0) * deltaTime * self.ki
+            self._deadbandTime = deadbandTime
 
-            # Integral part limitation
-            self.integralLimitReached = False
+            # ===== PID parts =====
+            integrate = not manualMode and not self.integralFreezing and (deadbandTime < self.deadbandActivationTime)
 
-            if self.integralLimit is not None:
-                if self._i > self.integralLimit:
-                    self._i = self.integralLimit
-
-                    self.integralLimitReached = True
-                    
-                elif self._i < -self.integralLimit:
-                    self._i = -self.integralLimit
-
-                    self.integralLimitReached = True
+            p, i, d, integralLimitReached = _pidStep(error, lastError, processValue, lastProcessValue, self._i, deltaTime, self.kp, self.ki, self.kd, integrate, self.proportionnalOnMeasurement, self.derivativeOnMeasurement, self._integralMin, self._integralMax)
             
             # Integral limit reached warning message
-            if (self.integralLimitReached and not self.memIntegralLimitReached and isinstance(self.logger, logging.Logger)):
-                self.logger.warning("Integral part has reached the limit (%d, %d)", -self.integralLimit, self.integralLimit)
+            if (integralLimitReached and not self.memIntegralLimitReached and isinstance(logger, logging.Logger)):
+                logger.warning("Integral part has reached the limit (%d, %d)", -self.integralLimit, self.integralLimit)
             
-            self.memIntegralLimitReached = self.integralLimitReached
-            
-            # ===== Derivative part =====
-            if (not self.derivativeOnMeasurement):
-                self._d = ((error - self._lastError) / deltaTime) * self.kd
-            else:
-                self._d = -((processValue - self._lastProcessValue) / deltaTime) * self.kd
+            self.integralLimitReached = integralLimitReached
+            self.memIntegralLimitReached = integralLimitReached
             
             # ===== Output =====
-            if (not self.manualMode):
-                _output = self._p + self._i + self._d
+            if (not manualMode):
+                _output = p + i + d
 
                 # Bumpless manual value
                 if (self.bumplessSwitching):
@@ -447,93 +707,80 @@ class PID:
                 _output = self.manualValue
 
             # Output limitation
-            self.outputLimitsReached = False
-
-            if self.outputLimits is not None:
-                if self.outputLimits[0] is not None:
-                    if _output < self.outputLimits[0]:
-                        _output = self.outputLimits[0]
-
-                        self.outputLimitsReached = True
-                if self.outputLimits[1] is not None:
-                    if _output > self.outputLimits[1]:
-                        _output = self.outputLimits[1]
-                        
-                        self.outputLimitsReached = True
+            outputMin = self._outputMin
+            outputMax = self._outputMax
+            outputLimitsReached = _output < outputMin or _output > outputMax
+            _output = outputMin if _output < outputMin else (outputMax if _output > outputMax else _output)
             
             # Output limit reached warning message
-            if (self.outputLimitsReached and not self.memoutputLimitsReached and isinstance(self.logger, logging.Logger)):
-                self.logger.warning("Output limits reached (%d, %d)", self.outputLimits[0], self.outputLimits[1])
+            if (outputLimitsReached and not self.memoutputLimitsReached and isinstance(logger, logging.Logger)):
+                logger.warning("Output limits reached (%d, %d)", self.outputLimits[0], self.outputLimits[1])
             
-            self.memoutputLimitsReached = self.outputLimitsReached
+            self.outputLimitsReached = outputLimitsReached
+            self.memoutputLimitsReached = outputLimitsReached
 
             # Interal part equal to output in manual mode
-            if (self.manualMode):
-                self._i = _output - self._p
+            if (manualMode):
+                i = _output - p
             
-            # ===== Output =====
+            # ===== Saving data for next execution =====
+            self._p = p
+            self._i = i
+            self._d = d
             self.output = _output
 
+            self._lastError = error
+            self._lastTime = actualTime
+            self._lastProcessValue = processValue
+
             # ===== Historian =====
-            if self.historian is not None:
-                if HistorianParams.P in self.historianParams:
-                    self.historian["P"].append(self._p)
-                    
-                    if len(self.historian["P"]) > self.historianLenght:
-                        del self.historian["P"][0]
+            if self._logAll:
+                historianCount = self._historianCount
+                index = historianCount % self.historianLenght
+
+                _historianRecord.pack_into(self._historianRecords, index * _historianRecord.size, p, i, d, _output, currentSetpoint, processValue, error, actualTime - self._startTime)
+
+                self._historianCount = historianCount + 1
+
+                if (self._historianQueue is not None and index == self.historianLenght - 1):
+                    self._historianQueue.put([v.tobytes() for v in self._historianColumns().values()])
+            elif self._logAny:
+                historianCount = self._historianCount
+                index = historianCount % self.historianLenght
+
+                if self._logP:
+                    self._histP[index] = p
                 
-                if HistorianParams.I in self.historianParams:
-                    self.historian["I"].append(self._i)
-                    
-                    if len(self.historian["I"]) > self.historianLenght:
-                        del self.historian["I"][0]
-
-                if HistorianParams.D in self.historianParams:
-                    self.historian["D"].append(self._d)
-                    
-                    if len(self.historian["D"]) > self.historianLenght:
-                        del self.historian["D"][0]
+                if self._logI:
+                    self._histI[index] = i
+
+                if self._logD:
+                    self._histD[index] = d
                 
-                if HistorianParams.OUTPUT in self.historianParams:
-                    self.historian["OUTPUT"].append(self.output)
-                    
-                    if len(self.historian["OUTPUT"]) > self.historianLenght:
-                        del self.historian["OUTPUT"][0]
+                if self._logOutput:
+                    self._histOutput[index] = _output
                 
-                if HistorianParams.SETPOINT in self.historianParams:
-                    self.historian["SETPOINT"].append(self._setpoint)
-                    
-                    if len(self.historian["SETPOINT"]) > self.historianLenght:
-                        del self.historian["SETPOINT"][0]
+                if self._logSetpoint:
+                    self._histSetpoint[index] = currentSetpoint
                 
-                if HistorianParams.PROCESS_VALUE in self.historianParams:
-                    self.historian["PROCESS_VALUE"].append(processValue)
-                    
-                    if len(self.historian["PROCESS_VALUE"]) > self.historianLenght:
-                        del self.historian["PROCESS_VALUE"][0]
-
-                if HistorianParams.ERROR in self.historianParams:
-                    self.historian["ERROR"].append(error)
-                    
-                    if len(self.historian["ERROR"]) > self.historianLenght:
-                        del self.historian["ERROR"][0]
-
-                if (HistorianParams.P in self.historianParams) or (HistorianParams.I in self.historianParams) or (HistorianParams.D in self.historianParams) or (HistorianParams.ERROR in self.historianParams) or (HistorianParams.OUTPUT in self.historianParams) or (HistorianParams.PROCESS_VALUE in self.historianParams) or (HistorianParams.SETPOINT in self.historianParams):
-                    self.historian["TIME"].append(actualTime - self._startTime)
-                    
-                    if len(self.historian["TIME"]) > self.historianLenght:
-                        del self.historian["TIME"][0]
-            
-            # ===== Saving data for next execution =====
-            self._lastError = error
-            self._lastTime = actualTime
-            self._lastProcessValue = processValue
+                if self._logProcessValue:
+                    self._histProcessValue[index] = processValue
+
+                if self._logError:
+                    self._histError[index] = error
+
+                self._histTime[index] = actualTime - self._startTime
+
+                self._historianCount = historianCount + 1
+
+                if (self._historianQueue is not None and index == self.historianLenght - 1):
+                    self._historianQueue.put([v.tobytes() for v in self._historianBuffers.values()])
 
             # ===== Simulation =====
             if self.simulation is not None:
-                self.simulation(self.output, actualTime)
+                self.simulation(_output, actualTime)
 
-            return self.output
+            return _output
         else: # First execution
             self._startTime = actualTime
             self._lastTime = actualTime
@@ -555,8 +802,8 @@ class PID:
             Leave it to `None` when the simulation is used.
 
         currentTime: float, default = None
-            The current time. For simulation purpose only.
-            Leave it to `None` for a real application.
+            The current time (second). For simulation purpose only.
+            Leave it to `None` for a real application, the monotonic performance counter (`time.perf_counter`) is used.
         
         Returns
         -------
@@ -565,6 +812,129 @@ class PID:
         """
         return self.compute(setpoint, processValue, currentTime)
 
+    def closeHistorianFile(self) -> None:
+        """
+        Write the historian blocks waiting in the queue to `historianFile` and stop the writer thread.
+        The next records are no longer saved in the file. Done automatically at the interpreter exit.
+
+        Parameters
+        ----------
+            None
+        
+        Returns
+        -------
+            None
+        """
+        if self._historianQueue is not None:
+            historianQueue = self._historianQueue
+            self._historianQueue = None
+
+            _historianWriterStop(historianQueue)
+
+    def computeBatch(self, setpoints, processValues, times):
+        """
+        PID calculation over recorded samples, for offline tuning or replay. Requires numpy.
+        The calculation starts from a reset state (as a new PID with the same parameters), the PID itself is not modified.
+        Without setpoint ramp, deadband, manual mode and integral freezing, and with increasing times, the calculation is vectorized (except the integral limitation).
+        Otherwise, `compute` is executed for each sample.
+
+        Parameters
+        ----------
+        setpoints: array_like
+            The target value for each sample
+
+        processValues: array_like
+            The system feedback for each sample
+
+        times: array_like
+            The time (second) of each sample
+        
+        Returns
+        -------
+        numpy.ndarray
+            PID output for each sample. The first one is 0.0, as for the first execution of `compute`.
+        """
+        import numpy as np
+
+        setpoints = np.asarray(setpoints, dtype=np.float64)
+        processValues = np.asarray(processValues, dtype=np.float64)
+        times = np.asarray(times, dtype=np.float64)
+
+        if not (setpoints.shape == processValues.shape == times.shape and setpoints.ndim == 1):
+            raise ValueError("`setpoints`, `processValues` and `times` must be 1-D arrays of the same lenght!")
+
+        outputs = np.zeros(setpoints.shape[0])
+
+        if setpoints.shape[0] < 2:
+            return outputs
+
+        deltaTimes = np.diff(times)
+
+        # Without setpoint ramp, deadband and manual mode, the error only depends on the samples
+        # Non increasing times are skipped by `compute` (null or negative delta time), they are executed as such
+        direct = ((self.setpointRamp is None or self.setpointRamp <= 0.0) and self.deadband is None 
+                  and not self._manualMode and not self.integralFreezing and not self._setuptoolControl
+                  and bool(np.all(deltaTimes > 0.0)))
+
+        if direct:
+            # The first sample only initializes the time, last error and last process value are 0.0 on the second one
+            processValue = processValues[1:]
+
+            if self.indirectAction:
+                error = processValue - setpoints[1:]
+            else:
+                error = setpoints[1:] - processValue
+
+            lastError = np.concatenate(([0.0], error[:-1]))
+            lastProcessValue = np.concatenate(([0.0], processValue[:-1]))
+
+            if (not self.proportionnalOnMeasurement):
+                p = error * self.kp
+            else:
+                p = -processValue * self.kp
+
+            integralIncrements = ((error + lastError) / 2.0) * deltaTimes * self.ki
+
+            if (self.integralLimit is None):
+                i = np.cumsum(integralIncrements)
+            else:
+                # Clamped integral is the only serial dependency
+                integralMin, integralMax = self._integralMin, self._integralMax
+                integrals = []
+                integral = 0.0
+
+                for increment in integralIncrements.tolist():
+                    integral += increment
+                    integral = integralMax if integral > integralMax else (integralMin if integral < integralMin else integral)
+                    integrals.append(integral)
+
+                i = np.array(integrals)
+
+            if (not self.derivativeOnMeasurement):
+                d = ((error - lastError) / deltaTimes) * self.kd
+            else:
+                d = -((processValue - lastProcessValue) / deltaTimes) * self.kd
+
+            outputs[1:] = np.clip(p + i + d, self._outputMin, self._outputMax)
+        else:
+            # Serial dependencies (setpoint ramp, deadband, manual mode, integral freezing, SetupTool control, non increasing times), executed on a copy of the PID
+            replay = PID(self.kp, self.ki, self.kd, indirectAction=self.indirectAction, proportionnalOnMeasurement=self.proportionnalOnMeasurement, integralLimit=self.integralLimit, 
+                         derivativeOnMeasurement=self.derivativeOnMeasurement, setpointRamp=self.setpointRamp, setpointStableLimit=self.setpointStableLimit, setpointStableTime=self.setpointStableTime, 
+                         deadband=self.deadband, deadbandActivationTime=self.deadbandActivationTime, processValueStableLimit=self.processValueStableLimit, processValueStableTime=self.processValueStableTime, 
+                         outputLimits=self.outputLimits)
+            
+            replay.integralFreezing = self.integralFreezing
+            replay._manualMode = self._manualMode
+            replay.manualValue = self.manualValue
+            replay.bumplessSwitching = self.bumplessSwitching
+            replay._setuptoolControl = self._setuptoolControl
+            replay._setuptoolSetpoint = self._setuptoolSetpoint
+
+            for k in range(setpoints.shape[0]):
+                outputs[k] = replay.compute(float(setpoints[k]), float(processValues[k]), float(times[k]))
+
+        return outputs
+
 class ThreadedPID(PID, Thread):
     """
     PID controller in a thread. Inherit from `PID` and `threading.Thread`.
@@ -657,6 +1027,15 @@ class ThreadedPID(PID, Thread):
         Define the minimum time between two PID calculations.
         If this time is lower than the real execution time, there is no pause between execution.
         If `cycleTime` is higher than the real execution time, a pause is made to wait `cycleTime` since the start of the previous execution.
+        When `cycleTime` is higher than 0.0, the PID calculation uses exactly `cycleTime` as delta time.
+    
+    historianFile: str, default = None
+        Same as `historianFile` in `PID` parameters section.
+    
+    sleepPrecision: float, default = 0.0
+        Duration (second) of active wait at the end of each pause, to start the calculation exactly at the end of `cycleTime`.
+        The pause precision depends on the OS scheduler (about 0.002 on Linux and 0.016 on Windows). An active wait uses the CPU, 0.0 disables it.
+        When the PID is late more than one cycle, the missed cycles are dropped.
 
     Attributes
     ----------
@@ -665,28 +1044,50 @@ class ThreadedPID(PID, Thread):
     
     processValue: float
         The current system feedback used for the PID calculation. For a better PID, update it more faster than the PID execution.
+        `setpoint` and `processValue` can be written from another thread without lock (single attribute assignments are atomic).
     
     cycleTime: float
         Same as `cycleTime` in parameters section.
     
+    sleepPrecision: float
+        Same as `sleepPrecision` in parameters section.
+    
     quit: bool
-        When the threaded PID is started, it can be stopped by setting `quit` to `True`. The PID finish the current execution and stop the thread.
+        When the threaded PID is started, it can be stopped by setting `quit` to `True`. The PID finish the current execution and stop the thread, without waiting the end of the pause.
     
     Methods
     -------
     start()
         Used to start the thread.
     """
-    def __init__(self, kp: float, ki: float, kd: float, indirectAction: bool = False, proportionnalOnMeasurement: bool = False, integralLimit: float = None, derivativeOnMeasurment: bool = False, setpointRamp: float = None, setpointStableLimit: float = None, setpointStableTime: float = 1.0, deadband: float = None, deadbandActivationTime: float = 1.0, processValueStableLimit: float = None, processValueStableTime: float = 1.0, historianParams: HistorianParams = None, historianLenght: int = 100000, outputLimits: tuple[float, float] = (None, None), logger: logging.Logger = None, simulation: Simulation = None, cycleTime: float = 0.0) -> None:
-        PID.__init__(self, kp, ki, kd, indirectAction, proportionnalOnMeasurement, integralLimit, derivativeOnMeasurment, setpointRamp, setpointStableLimit, setpointStableTime, deadband, deadbandActivationTime, processValueStableLimit, processValueStableTime, historianParams, historianLenght, outputLimits, logger, simulation)
+    __slots__ = ("setpoint", "processValue", "cycleTime", "sleepPrecision", "_quit", "_stopEvent")
+
+    def __init__(self, kp: float, ki: float, kd: float, indirectAction: bool = False, proportionnalOnMeasurement: bool = False, integralLimit: float = None, derivativeOnMeasurment: bool = False, setpointRamp: float = None, setpointStableLimit: float = None, setpointStableTime: float = 1.0, deadband: float = None, deadbandActivationTime: float = 1.0, processValueStableLimit: float = None, processValueStableTime: float = 1.0, historianParams: HistorianParams = None, historianLenght: int = 100000, outputLimits: tuple[float, float] = (None, None), logger: logging.Logger = None, simulation: Simulation = None, cycleTime: float = 0.0, historianFile: str = None, sleepPrecision: float = 0.0) -> None:
+        PID.__init__(self, kp, ki, kd, indirectAction, proportionnalOnMeasurement, integralLimit, derivativeOnMeasurment, setpointRamp, setpointStableLimit, setpointStableTime, deadband, deadbandActivationTime, processValueStableLimit, processValueStableTime, historianParams, historianLenght, outputLimits, logger, simulation, historianFile)
         Thread.__init__(self)
 
         self.setpoint = 0.0
         self.processValue = 0.0
         self.cycleTime = cycleTime
+        self.sleepPrecision = sleepPrecision
 
+        # Set when `quit` is set, to wake up the thread during the pause
+        self._stopEvent = Event()
         self.quit = False
     
+    @property
+    def quit(self) -> bool:
+        return self._quit
+    
+    @quit.setter
+    def quit(self, value: bool) -> None:
+        self._quit = value
+
+        if value:
+            self._stopEvent.set()
+        else:
+            self._stopEvent.clear()
+    
     def start(self) -> None:
         """
         Used to start the threaded PID. Overrided from `threading.Thread`
@@ -702,8 +1103,125 @@ class ThreadedPID(PID, Thread):
         Thread execution. Overrided from `threading.Thread`
         See `threading.Thread` documentation for more information
         """
+        # Absolute deadlines from a reference time (the last execution when `cycleTime` changes), the execution time doesn't shift the next cycles
+        referenceTime = self._lastTime
+        referenceCycleTime = self.cycleTime
+        cycles = 0
+
+        while self._quit is False:
+            cycleTime = self.cycleTime
+
+            # Without cycle time (0.0 or negative), the PID is executed as fast as possible
+            if (cycleTime <= 0.0):
+                self.compute(self.setpoint, self.processValue if self.simulation is None else None)
+                referenceTime, referenceCycleTime, cycles = self._lastTime, cycleTime, 0
+                continue
+
+            if (cycleTime != referenceCycleTime):
+                referenceTime, referenceCycleTime, cycles = self._lastTime, cycleTime, 0
+
+            cycles, nextTime = _nextDeadline(referenceTime, cycles, cycleTime)
+            remainingTime = nextTime - _perfCounter()
+
+            # Coarse pause, then active wait during the last `sleepPrecision` seconds (OS scheduler granularity)
+            sleepPrecision = self.sleepPrecision
+
+            if (remainingTime > sleepPrecision and self._stopEvent.wait(remainingTime - sleepPrecision)):
+                break
+
+            if (sleepPrecision > 0.0):
+                while _perfCounter() < nextTime:
+                    pass
+
+            # With a fixed cycle, the deadline is used as time: delta time is exactly `cycleTime`, without sleep jitter
+            self.compute(self.setpoint, self.processValue if self.simulation is None else None, nextTime)
+
+class AsyncPID(PID):
+    """
+    PID controller in an `asyncio` task. Inherit from `PID`.
+    Several PID can be executed in the same thread (one event loop), instead of one thread per PID with `ThreadedPID`.
+
+    Parameters
+    ----------
+    cycleTime: float, default = 0.0
+        Define the minimum time between two PID calculations.
+        If `cycleTime` is 0.0, the PID calculation is executed each time the event loop gives the hand back.
+        When `cycleTime` is higher than 0.0, the PID calculation uses exactly `cycleTime` as delta time.
+    
+    Other parameters are the same as `PID` parameters.
+
+    Attributes
+    ----------
+    setpoint: float
+        The current target value used for the PID calculation.
+    
+    processValue: float
+        The current system feedback used for the PID calculation.
+    
+    cycleTime: float
+        Same as `cycleTime` in parameters section.
+    
+    quit: bool
+        When the PID is running, it can be stopped by setting `quit` to `True`. The PID finish the current cycle and `run` returns.
+    
+    Methods
+    -------
+    run()
+        Coroutine executing the PID until `quit` is set to `True`.
+    """
+    __slots__ = ("setpoint", "processValue", "cycleTime", "quit")
+
+    def __init__(self, kp: float, ki: float, kd: float, indirectAction: bool = False, proportionnalOnMeasurement: bool = False, integralLimit: float = None, derivativeOnMeasurement: bool = False, setpointRamp: float = None, setpointStableLimit: float = None, setpointStableTime: float = 1.0, deadband: float = None, deadbandActivationTime: float = 1.0, processValueStableLimit: float = None, processValueStableTime: float = 1.0, historianParams: HistorianParams = None, historianLenght: int = 100000, outputLimits: tuple[float, float] = (None, None), logger: logging.Logger = None, simulation: Simulation = None, cycleTime: float = 0.0, historianFile: str = None) -> None:
+        PID.__init__(self, kp, ki, kd, indirectAction, proportionnalOnMeasurement, integralLimit, derivativeOnMeasurement, setpointRamp, setpointStableLimit, setpointStableTime, deadband, deadbandActivationTime, processValueStableLimit, processValueStableTime, historianParams, historianLenght, outputLimits, logger, simulation, historianFile)
+
+        self.setpoint = 0.0
+        self.processValue = 0.0
+        self.cycleTime = cycleTime
+
+        self.quit = False
+    
+    async def run(self) -> None:
+        """
+        Execute the PID until `quit` is set to `True`. Start it with `asyncio.create_task(pid.run())` or `asyncio.gather`.
+        `quit` set before the task starts is kept (the PID isn't executed). To execute it again, set `quit` to `False` before.
+        """
+        # Stopped before the task starts, `quit` isn't reset here (the task is executed after `create_task` returns)
+        if self.quit:
+            return
+
+        # Call PID execution to initialize time memory
+        self.compute(self.setpoint, self.processValue if self.simulation is None else None)
+
+        # Absolute deadlines from a reference time (the last execution when `cycleTime` changes), the execution time doesn't shift the next cycles
+        referenceTime = self._lastTime
+        referenceCycleTime = self.cycleTime
+        cycles = 0
+
         while self.quit is False:
-            while time.time() < (self._lastTime + self.cycleTime):
-                time.sleep(self.cycleTime / 100.0)
+            cycleTime = self.cycleTime
+
+            # Without cycle time (0.0 or negative), the PID is executed each time the event loop gives the hand back
+            if (cycleTime <= 0.0):
+                await asyncio.sleep(0.0)
+
+                if self.quit:
+                    break
+
+                self.compute(self.setpoint, self.processValue if self.simulation is None else None)
+                referenceTime, referenceCycleTime, cycles = self._lastTime, cycleTime, 0
+                continue
+
+            if (cycleTime != referenceCycleTime):
+                referenceTime, referenceCycleTime, cycles = self._lastTime, cycleTime, 0
+
+            cycles, nextTime = _nextDeadline(referenceTime, cycles, cycleTime)
+            remainingTime = nextTime - _perfCounter()
+
+            # Always give the hand back to the event loop, even when the cycle is late
+            await asyncio.sleep(remainingTime if remainingTime > 0.0 else 0.0)
+
+            if self.quit:
+                break
 
-            self.compute(self.setpoint, self.processValue if self.simulation is None else None)
\ No newline at end of file
+            # With a fixed cycle, the deadline is used as time: delta time is exactly `cycleTime`, without sleep jitter
+            self.compute(self.setpoint, self.processValue if self.simulation is None else None, nextTime)
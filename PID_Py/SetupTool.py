@@ -1,12 +1,13 @@
 import sys
 
-from PySide6.QtGui import QPainter, QActionGroup
+from PySide6.QtGui import QPainter, QActionGroup, QFont
 from PySide6.QtWidgets import QMainWindow, QWidget, QDoubleSpinBox, QLabel, QFrame, QCheckBox, QTimeEdit, QScrollArea, QMenuBar, QMenu, QMessageBox, QPushButton
 from PySide6.QtWidgets import QHBoxLayout, QGridLayout
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
-from PySide6.QtCore import QTimer, Qt, QTime, QPointF
+from PySide6.QtCore import QTimer, Qt, QTime, QPointF, Slot
 
 import logging
+from collections import deque
 
 from PID_Py.PID import PID
 
@@ -18,8 +19,14 @@ class SetupToolApp(QMainWindow):
     ----------
     pid: PID_Py.PID.PID
         The monitored PID
+    
+    useOpenGL: bool, default = False
+        Draw the historian series with OpenGL (less CPU usage with many points). Requires OpenGL support on the system.
+
+    antialiasing: bool, default = True
+        Draw the chart with antialiasing. Disable it to reduce the drawing time (on a Raspberry Pi for example).
     """
-    def __init__(self, pid: PID) -> None:
+    def __init__(self, pid: PID, useOpenGL: bool = False, antialiasing: bool = True) -> None:
         super().__init__()
 
         self.pid = pid
@@ -107,23 +114,28 @@ class SetupToolApp(QMainWindow):
 
         self.series = {}
         self.seriesData = {}
+        self.seriesValues = {}
 
-        for k in self.pid.historian.keys():
+        # Displayed points, the oldest ones are removed when `historianMaxNbPoint` is reached
+        for k in (self.pid._historianLast(0) or {}).keys():
             if k != "TIME":
                 self.series[k] = QLineSeries()
                 self.series[k].setName(k)
+                self.series[k].setUseOpenGL(useOpenGL)
 
                 self.chart.addSeries(self.series[k])
 
                 self.series[k].attachAxis(self.xAxis)
                 self.series[k].attachAxis(self.yAxis)
 
-                self.seriesData[k] = []
+                self.seriesData[k] = deque(maxlen=self.historianMaxNbPoint)
+                self.seriesValues[k] = deque(maxlen=self.historianMaxNbPoint)
 
-        self.lastTime = None
+        # Number of PID records already displayed
+        self.lastCount = 0
 
         self.chartView = QChartView(self.chart)
-        self.chartView.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.chartView.setRenderHint(QPainter.RenderHint.Antialiasing, antialiasing)
 
         # ===== Parameters =====
         self.parametersScrollArea = QScrollArea()
@@ -139,8 +151,13 @@ class SetupToolApp(QMainWindow):
         self.parametersLayout.setColumnStretch(1, 3)
         self.parametersLayout.setColumnStretch(2, 1)
 
+        # Section titles font, shared instead of a style sheet parsed for each title
+        titleFont = QFont()
+        titleFont.setPixelSize(24)
+
         # Gains (Kp, ki and kd)
         self.kpSpinBox = QDoubleSpinBox()
+        self.kpSpinBox.setKeyboardTracking(False)
         self.kpSpinBox.setEnabled(False)
         self.kpSpinBox.setSingleStep(0.1)
         self.kpSpinBox.setDecimals(3)
@@ -154,6 +171,7 @@ class SetupToolApp(QMainWindow):
         self.kpSpinBox.valueChanged.connect(self.kpChanged)
 
         self.kiSpinBox = QDoubleSpinBox()
+        self.kiSpinBox.setKeyboardTracking(False)
         self.kiSpinBox.setEnabled(False)
         self.kiSpinBox.setSingleStep(0.1)
         self.kiSpinBox.setDecimals(3)
@@ -167,6 +185,7 @@ class SetupToolApp(QMainWindow):
         self.kiSpinBox.valueChanged.connect(self.kiChanged)
 
         self.kdSpinBox = QDoubleSpinBox()
+        self.kdSpinBox.setKeyboardTracking(False)
         self.kdSpinBox.setEnabled(False)
         self.kdSpinBox.setSingleStep(0.1)
         self.kdSpinBox.setDecimals(3)
@@ -181,7 +200,7 @@ class SetupToolApp(QMainWindow):
 
         gainLabel = QLabel("Gains")
         gainLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        gainLabel.setStyleSheet("font-size: 24px")
+        gainLabel.setFont(titleFont)
 
         self.parametersLayout.addWidget(gainLabel, 0, 0, 1, 3)
 
@@ -225,6 +244,7 @@ class SetupToolApp(QMainWindow):
         self.integralLimitEnableCheckBox.stateChanged.connect(self.integralLimitEnableChanged)
 
         self.integralLimitSpinBox = QDoubleSpinBox()
+        self.integralLimitSpinBox.setKeyboardTracking(False)
         self.integralLimitSpinBox.setEnabled(False)
         self.integralLimitSpinBox.setToolTip("Clamp integral term between [-value, value]")
         self.integralLimitSpinBox.setToolTipDuration(5000)
@@ -246,6 +266,7 @@ class SetupToolApp(QMainWindow):
         self.setpointRampEnableCheckBox.stateChanged.connect(self.setpointRampEnableChanged)
 
         self.setpointRampSpinBox = QDoubleSpinBox()
+        self.setpointRampSpinBox.setKeyboardTracking(False)
         self.setpointRampSpinBox.setEnabled(False)
         self.setpointRampSpinBox.setToolTip("Apply a ramp on the setpoint (unit/s)")
         self.setpointRampSpinBox.setToolTipDuration(5000)
@@ -260,6 +281,7 @@ class SetupToolApp(QMainWindow):
         self.setpointStableLimitEnableCheckBox.stateChanged.connect(self.setpointStableEnableChanged)
 
         self.setpointStableLimitSpinBox = QDoubleSpinBox()
+        self.setpointStableLimitSpinBox.setKeyboardTracking(False)
         self.setpointStableLimitSpinBox.setEnabled(False)
         self.setpointStableLimitSpinBox.setToolTip("Maximum difference between the setpoint and the process value to be considered reached")
         self.setpointStableLimitSpinBox.setToolTipDuration(5000)
@@ -272,6 +294,7 @@ class SetupToolApp(QMainWindow):
         self.setpointStableTimeLabel.setToolTipDuration(5000)
 
         self.setpointStableTimeTimeEdit = QTimeEdit()
+        self.setpointStableTimeTimeEdit.setKeyboardTracking(False)
         self.setpointStableTimeTimeEdit.setEnabled(False)
         self.setpointStableTimeTimeEdit.setToolTip("Maximum difference between the setpoint and the process value to be considered reached")
         self.setpointStableTimeTimeEdit.setToolTipDuration(5000)
@@ -288,6 +311,7 @@ class SetupToolApp(QMainWindow):
         self.deadbandEnableCheckBox.stateChanged.connect(self.deadbandEnableChanged)
 
         self.deadbandSpinBox = QDoubleSpinBox()
+        self.deadbandSpinBox.setKeyboardTracking(False)
         self.deadbandSpinBox.setEnabled(False)
         self.deadbandSpinBox.setToolTip("The minimum amount of output variation to applied this variation")
         self.deadbandSpinBox.setToolTipDuration(5000)
@@ -300,6 +324,7 @@ class SetupToolApp(QMainWindow):
         self.deadbandActivationTimeLabel.setToolTipDuration(5000)
 
         self.deadbandActivationTimeTimeEdit = QTimeEdit()
+        self.deadbandActivationTimeTimeEdit.setKeyboardTracking(False)
         self.deadbandActivationTimeTimeEdit.setEnabled(False)
         self.deadbandActivationTimeTimeEdit.setToolTip("The minimum amount of output variation to applied this variation")
         self.deadbandActivationTimeTimeEdit.setToolTipDuration(5000)
@@ -316,6 +341,7 @@ class SetupToolApp(QMainWindow):
         self.processValueStableLimitEnableCheckBox.stateChanged.connect(self.processValueStableLimitEnableChanged)
 
         self.processValueStableLimitSpinBox = QDoubleSpinBox()
+        self.processValueStableLimitSpinBox.setKeyboardTracking(False)
         self.processValueStableLimitSpinBox.setEnabled(False)
         self.processValueStableLimitSpinBox.setToolTip("The maximum variation of the process value to be considered stable")
         self.processValueStableLimitSpinBox.setToolTipDuration(5000)
@@ -328,6 +354,7 @@ class SetupToolApp(QMainWindow):
         self.processValueStableTimeLabel.setToolTipDuration(5000)
 
         self.processValueStableTimeTimeEdit = QTimeEdit()
+        self.processValueStableTimeTimeEdit.setKeyboardTracking(False)
         self.processValueStableTimeTimeEdit.setEnabled(False)
         self.processValueStableTimeTimeEdit.setToolTip("The maximum variation of the process value to be considered stable")
         self.processValueStableTimeTimeEdit.setToolTipDuration(5000)
@@ -339,7 +366,7 @@ class SetupToolApp(QMainWindow):
 
         parametersLabel = QLabel("Parameters")
         parametersLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        parametersLabel.setStyleSheet("font-size: 24px")
+        parametersLabel.setFont(titleFont)
 
         self.parametersLayout.addWidget(parametersLabel, 5, 0, 1 ,3)
 
@@ -386,6 +413,7 @@ class SetupToolApp(QMainWindow):
         self.outputLimitMaxEnableCheckBox.stateChanged.connect(self.maximumLimitEnableChanged)
 
         self.outputLimitMaxSpinBox = QDoubleSpinBox()
+        self.outputLimitMaxSpinBox.setKeyboardTracking(False)
         self.outputLimitMaxSpinBox.setEnabled(False)
         self.outputLimitMaxSpinBox.setToolTip("Maximum output")
         self.outputLimitMaxSpinBox.setToolTipDuration(5000)
@@ -408,6 +436,7 @@ class SetupToolApp(QMainWindow):
         self.outputLimitMinEnableCheckBox.stateChanged.connect(self.minimumLimitEnableChanged)
 
         self.outputLimitMinSpinBox = QDoubleSpinBox()
+        self.outputLimitMinSpinBox.setKeyboardTracking(False)
         self.outputLimitMinSpinBox.setEnabled(False)
         self.outputLimitMinSpinBox.setToolTip("Minimum output")
         self.outputLimitMinSpinBox.setToolTipDuration(5000)
@@ -423,7 +452,7 @@ class SetupToolApp(QMainWindow):
 
         outputLimitLabel = QLabel("Output limits")
         outputLimitLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        outputLimitLabel.setStyleSheet("font-size: 24px")
+        outputLimitLabel.setFont(titleFont)
 
         self.parametersLayout.addWidget(outputLimitLabel, 18, 0, 1, 3)
 
@@ -442,12 +471,13 @@ class SetupToolApp(QMainWindow):
 
         setpointControlLabel = QLabel("Setpoint")
         setpointControlLabel.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        setpointControlLabel.setStyleSheet("font-size: 24px")
+        setpointControlLabel.setFont(titleFont)
 
         self.setpointLabel = QLabel("Setpoint")
         self.setpointLabel.setEnabled(False)
 
         self.setpointSpinBox = QDoubleSpinBox()
+        self.setpointSpinBox.setKeyboardTracking(False)
         self.setpointSpinBox.setEnabled(False)
         self.setpointSpinBox.setValue(self.pid._setuptoolSetpoint)
 
@@ -492,6 +522,7 @@ class SetupToolApp(QMainWindow):
 
         self.logger.debug("SetupTool initialized")
     
+    @Slot()
     def refreshData(self):
         """
         PID data collection
@@ -507,70 +538,39 @@ class SetupToolApp(QMainWindow):
         if not self.pid._setuptoolControl:
             self.setpointSpinBox.setValue(self.pid._setuptoolSetpoint)
 
-        historian = self.pid.historian
-        
-        if historian is not None:
-            if len(historian["TIME"]) >= 0:
-
-                countToAdd = 0
-
-                if self.lastTime is not None:
-                    for t in reversed(historian["TIME"]):
-                        if t <= self.lastTime:
-                            break;
-
-                        countToAdd += 1
-                else:
-                    countToAdd = -1
+        # Chart not displayed, the records are read when it's visible again (only the last ones are displayed)
+        if (self.isMinimized() or not self.chartView.isVisible()):
+            return
 
+        # Only the records added since the last refresh are read (count read once, the PID can run in another thread)
+        count = self.pid._historianCount
+        historian = self.pid._historianLast(min(count - self.lastCount, self.historianMaxNbPoint), count)
+        
+        if historian:
+            if len(historian["TIME"]) > 0:
                 yMin = None
                 yMax = None
 
                 for k, v in historian.items():
                     if k != "TIME":
-                        # First iteration, seriesData empty
-                        if countToAdd == -1:
-                            data = []
-
-                            for t, e in zip(historian["TIME"], v):
-                                data.append(QPointF(t, e))
-                            
-                            self.seriesData[k] = data
-                        
-                        # seriesData smaller than historiantMaxNbPoint
-                        elif len(historian["TIME"]) <= self.historianMaxNbPoint:
-                            for t, e in zip(historian["TIME"][-countToAdd:], v[-countToAdd:]):
-                                self.seriesData[k].append(QPointF(t, e))
-                        
-                        # seriesData larger than historianMaxNbPoint. Need to remove older sample to fit
-                        else:
-                            for t, e in zip(historian["TIME"][-countToAdd:], v[-countToAdd:]):
-                                self.seriesData[k].append(QPointF(t, e))
-                            
-                            countToRemove = len(self.seriesData[k]) - self.historianMaxNbPoint
-
-                            self.seriesData[k] = self.seriesData[k][countToRemove:]
+                        self.seriesData[k].extend(map(QPointF, historian["TIME"], v))
+                        self.seriesValues[k].extend(v)
 
                         # Search extremums
-                        if yMin is None:
-                            yMin = self.seriesData[k][0].y()
-                        
-                        if yMax is None:
-                            yMax = self.seriesData[k][0].y()
+                        seriesMin = min(self.seriesValues[k])
+                        seriesMax = max(self.seriesValues[k])
 
-                        for e in self.seriesData[k]:
-                            yMin = e.y() if e.y() < yMin else yMin
-                            yMax = e.y() if e.y() > yMax else yMax
+                        yMin = seriesMin if yMin is None or seriesMin < yMin else yMin
+                        yMax = seriesMax if yMax is None or seriesMax > yMax else yMax
 
                         # Update points
-                        self.series[k].replace(self.seriesData[k])
+                        self.series[k].replace(list(self.seriesData[k]))
 
-                # Save last sample time
-                self.lastTime = historian["TIME"][-1]
+                # Save displayed records count
+                self.lastCount = count
 
                 # Update axis range
-
-                key = list(self.seriesData.keys())[0]
+                key = next(iter(self.seriesData))
                 self.xAxis.setRange(self.seriesData[key][0].x(), self.seriesData[key][-1].x())
 
                 if yMax - yMin < 1:
@@ -812,6 +812,9 @@ class SetupToolApp(QMainWindow):
         -------
         None
         """
+        # Updates suspended while switching, the pane is repainted once
+        self.parametersWidget.setUpdatesEnabled(False)
+
         self.kpSetEnabled(True)
         self.kiSetEnabled(True)
         self.kdSetEnabled(True)
@@ -826,6 +829,8 @@ class SetupToolApp(QMainWindow):
         self.maximumLimitSetEnabled(True)
         self.minimumLimitSetEnabled(True)
 
+        self.parametersWidget.setUpdatesEnabled(True)
+
         self.logger.debug("Widgets parameters enabled")
 
     def disableWidgets(self):
@@ -840,6 +845,9 @@ class SetupToolApp(QMainWindow):
         -------
         None
         """
+        # Updates suspended while switching, the pane is repainted once
+        self.parametersWidget.setUpdatesEnabled(False)
+
         self.kpSetEnabled(False)
         self.kiSetEnabled(False)
         self.kdSetEnabled(False)
@@ -854,8 +862,11 @@ class SetupToolApp(QMainWindow):
         self.maximumLimitSetEnabled(False)
         self.minimumLimitSetEnabled(False)
 
+        self.parametersWidget.setUpdatesEnabled(True)
+
         self.logger.debug("Widgets parameters disabled")
     
+    @Slot(float)
     def kpChanged(self, value):
         """
         Kp changed slot
@@ -872,6 +883,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Kp value changed to {value:.2f}")
         self.pid.kp = value
     
+    @Slot(float)
     def kiChanged(self, value):
         """
         Ki changed slot
@@ -888,6 +900,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Ki value changed to {value:.2f}")
         self.pid.ki = value
 
+    @Slot(float)
     def kdChanged(self, value):
         """
         Kd changed slot
@@ -904,6 +917,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Kd value changed to {value:.2f}")
         self.pid.kd = value
 
+    @Slot(int)
     def indirectActionChanged(self, state):
         """
         Indirect action changed slot
@@ -921,6 +935,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Indirect action changed to {state}")
         self.pid.indirectAction = (state == Qt.CheckState.Checked)
     
+    @Slot(int)
     def proportionnalOnMeasurementChanged(self, state):
         """
         Proportionnal on measurement changed slot
@@ -938,6 +953,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Proportionnal on measurement changed to {state}")
         self.pid.proportionnalOnMeasurement = (state == Qt.CheckState.Checked)
     
+    @Slot(int)
     def integralLimitEnableChanged(self, state):
         """
         Integral limit enable changed slot
@@ -956,6 +972,7 @@ class SetupToolApp(QMainWindow):
         self.integralLimitSetEnabled(True)
         self.pid.integralLimit = self.integralLimitSpinBox.value() if (state == Qt.CheckState.Checked) else None
     
+    @Slot(float)
     def integralLimitChanged(self, value):
         """
         Integral limit changed slot
@@ -972,6 +989,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Integral limit changed to {value}")
         self.pid.integralLimit = value if (self.integralLimitEnableCheckBox.checkState() == Qt.CheckState.Checked) else None
 
+    @Slot(int)
     def derivativeOnMeasurementChanged(self, state):
         """
         Derivative on measurement enable changed slot
@@ -989,6 +1007,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Derivative on measurement changed to {state}")
         self.pid.derivativeOnMeasurement = (state == Qt.CheckState.Checked)
 
+    @Slot(int)
     def setpointRampEnableChanged(self, state):
         """
         Setpoint ramp enable changed slot
@@ -1007,6 +1026,7 @@ class SetupToolApp(QMainWindow):
         self.setpointRampSetEnabled(True)
         self.pid.setpointRamp = self.setpointRampSpinBox.value() if (state == Qt.CheckState.Checked) else None
     
+    @Slot(float)
     def setpointRampChanged(self, value):
         """
         Setpoint ramp changed slot
@@ -1023,6 +1043,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Setpoint ramp changed to {value}")
         self.pid.setpointRamp = value if (self.setpointRampEnableCheckBox.checkState() == Qt.CheckState.Checked) else None
     
+    @Slot(int)
     def setpointStableEnableChanged(self, state):
         """
         Setpoint stable enable changed slot
@@ -1041,6 +1062,7 @@ class SetupToolApp(QMainWindow):
         self.setpointStableSetEnabled(True)
         self.pid.setpointStableLimit = self.setpointStableLimitSpinBox.value() if (state == Qt.CheckState.Checked) else None
     
+    @Slot(float)
     def setpointStableChanged(self, value):
         """
         Setpoint stable changed slot
@@ -1057,6 +1079,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Setpoint stable changed to {value}")
         self.pid.setpointStableLimit = value if (self.setpointStableLimitEnableCheckBox.checkState() == Qt.CheckState.Checked) else None
 
+    @Slot(QTime)
     def setpointStableTimeChanged(self, time: QTime):
         """
         Setpoint stable time changed slot
@@ -1073,6 +1096,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Setpoint stable time changed to {time.toString('hh:mm:ss')}")
         self.pid.setpointStableTime = time.msecsSinceStartOfDay() / 1000
     
+    @Slot(int)
     def deadbandEnableChanged(self, state):
         """
         Deadband enable changed slot
@@ -1091,6 +1115,7 @@ class SetupToolApp(QMainWindow):
         self.deadbandSetEnabled(True)
         self.pid.deadband = self.deadbandSpinBox.value() if (state == Qt.CheckState.Checked) else None
     
+    @Slot(float)
     def deadbandChanged(self, value):
         """
         Deadband changed slot
@@ -1107,6 +1132,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Deadband changed to {value}")
         self.pid.deadband = value if (self.deadbandEnableCheckBox.checkState() == Qt.CheckState.Checked) else None
     
+    @Slot(QTime)
     def deadbandActivationTimeChanged(self, time: QTime):
         """
         Deadband activation time changed slot
@@ -1123,6 +1149,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Deadband activation time changed to {time.toString('hh:mm:ss')}")
         self.pid.deadbandActivationTime = time.msecsSinceStartOfDay() / 1000
     
+    @Slot(int)
     def processValueStableLimitEnableChanged(self, state):
         """
         Process value stable limit enable changed slot
@@ -1141,6 +1168,7 @@ class SetupToolApp(QMainWindow):
         self.processValueStableSetEnabled(True)
         self.pid.processValueStableLimit = self.processValueStableLimitSpinBox.value() if (state == Qt.CheckState.Checked) else None
     
+    @Slot(float)
     def processValueStableLimitChanged(self, value):
         """
         Process value stable limit changed slot
@@ -1157,6 +1185,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Process value stable limit changed to {value}")
         self.pid.processValueStableLimit = value if (self.processValueStableLimitEnableCheckBox.checkState() == Qt.CheckState.Checked) else None
     
+    @Slot(QTime)
     def processValueStableTimeChanged(self, time: QTime):
         """
         Process value stable time changed slot
@@ -1173,6 +1202,7 @@ class SetupToolApp(QMainWindow):
         self.logger.debug(f"Process value stable time changed to {time.toString('hh:mm:ss')}")
         self.pid.processValueStableTime = time.msecsSinceStartOfDay() / 1000
 
+    @Slot(int)
     def maximumLimitEnableChanged(self, state):
         """
         Maximum limit enable changed slot
@@ -1193,6 +1223,7 @@ class SetupToolApp(QMainWindow):
         self.pid.outputLimits = (self.outputLimitMinSpinBox.value() if self.outputLimitMinEnableCheckBox.checkState() == Qt.CheckState.Checked else None, 
                                  self.outputLimitMaxSpinBox.value() if self.outputLimitMaxEnableCheckBox.checkState() == Qt.CheckState.Checked else None)
     
+    @Slot(float)
     def maximumLimitChanged(self, value):
         """
         Maximum limit changed slot
@@ -1211,6 +1242,7 @@ class SetupToolApp(QMainWindow):
         self.pid.outputLimits = (self.outputLimitMinSpinBox.value() if self.outputLimitMinEnableCheckBox.checkState() == Qt.CheckState.Checked else None, 
                                  self.outputLimitMaxSpinBox.value() if self.outputLimitMaxEnableCheckBox.checkState() == Qt.CheckState.Checked else None)
 
+    @Slot(int)
     def minimumLimitEnableChanged(self, state):
         """
         Minimum limit enable changed slot
@@ -1231,6 +1263,7 @@ class SetupToolApp(QMainWindow):
         self.pid.outputLimits = (self.outputLimitMinSpinBox.value() if self.outputLimitMinEnableCheckBox.checkState() == Qt.CheckState.Checked else None, 
                                  self.outputLimitMaxSpinBox.value() if self.outputLimitMaxEnableCheckBox.checkState() == Qt.CheckState.Checked else None)
     
+    @Slot(float)
     def minimumLimitChanged(self, value):
         """
         Minimum limit changed slot
@@ -1249,6 +1282,7 @@ class SetupToolApp(QMainWindow):
         self.pid.outputLimits = (self.outputLimitMinSpinBox.value() if self.outputLimitMinEnableCheckBox.checkState() == Qt.CheckState.Checked else None, 
                                  self.outputLimitMaxSpinBox.value() if self.outputLimitMaxEnableCheckBox.checkState() == Qt.CheckState.Checked else None)
     
+    @Slot()
     def applySetpoint(self):
         """
         Send setpoint to the PID
@@ -1265,6 +1299,7 @@ class SetupToolApp(QMainWindow):
         if (self.pid._setuptoolControl):
             self.pid._setuptoolSetpoint = self.setpointSpinBox.value()
     
+    @Slot()
     def takeControl(self):
         """
         Take control on the PID's setpoint
@@ -1283,6 +1318,7 @@ class SetupToolApp(QMainWindow):
         self.controlLabel.setText("Control taken")
         self.statusBar().showMessage("Control on PID taken", 10000)
 
+    @Slot()
     def releaseControl(self):
         """
         Release control on the PID's setpoint
@@ -1301,6 +1337,7 @@ class SetupToolApp(QMainWindow):
         self.controlLabel.setText("Control released")
         self.statusBar().showMessage("Control on PID released", 10000)
 
+    @Slot()
     def setReadOnlyMode(self):
         """
         Activate read-only mode on the PID's parameters
@@ -1317,6 +1354,7 @@ class SetupToolApp(QMainWindow):
         self.statusBar().showMessage("Read-only mode activated", 10000)
         self.disableWidgets()
 
+    @Slot()
     def setReadWriteMode(self):
         """
         Activate read-write mode on the PID's parameters
@@ -14,7 +14,7 @@ class Simulation:
         
     def __call__(self, input: float, t: float = None) -> float:
         if (t is None):
-            actualTime = time.time()
+            actualTime = time.perf_counter()
         else:
             actualTime = t
 
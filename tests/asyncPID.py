@@ -0,0 +1,66 @@
+import PID_Py.PID as PID
+import PID_Py.Simulation as Sim
+from PID_Py.PID import HistorianParams as HistParams
+
+import time
+import asyncio
+import matplotlib.pyplot as plt
+
+timeLenght = 10.0
+
+async def main():
+    # Two PID executed in the same thread, each one with its own system
+    pids = [PID.AsyncPID(kp = 1.0, ki = 1.0, kd = 0.0, cycleTime = 0.01, historianParams=(HistParams.OUTPUT | HistParams.PROCESS_VALUE | HistParams.SETPOINT)),
+            PID.AsyncPID(kp = 2.0, ki = 0.5, kd = 0.0, cycleTime = 0.01, historianParams=(HistParams.OUTPUT | HistParams.PROCESS_VALUE | HistParams.SETPOINT))]
+    systems = [Sim.Simulation(1.0, 0.1), Sim.Simulation(1.0, 0.5)]
+
+    tasks = [asyncio.create_task(pid.run()) for pid in pids]
+
+    startTime = time.time()
+
+    while time.time() - startTime < timeLenght:
+        for pid, system in zip(pids, systems):
+            if time.time() - startTime >= 1.0:
+                pid.setpoint = 10.0
+
+            pid.processValue = system.output
+            system(pid.output)
+
+        await asyncio.sleep(0.001)
+
+    for pid in pids:
+        pid.quit = True
+
+    await asyncio.gather(*tasks)
+
+    return pids
+
+async def stopBeforeStart():
+    # `quit` set before the task is executed (shutdown just after the creation), `run` returns without executing the PID
+    pid = PID.AsyncPID(kp = 1.0, ki = 1.0, kd = 0.0, cycleTime = 0.01)
+
+    task = asyncio.create_task(pid.run())
+    pid.quit = True
+
+    await asyncio.wait_for(task, 1.0)
+
+asyncio.run(stopBeforeStart())
+
+print("Start...")
+print(f"This will be take {timeLenght} secondes")
+
+pids = asyncio.run(main())
+
+fig, plots = plt.subplots(len(pids), sharex=True)
+
+for pid, plot in zip(pids, plots):
+    # Copy of the records, read once
+    historian = pid.historian
+
+    plot.plot(historian["TIME"], historian["SETPOINT"], label="Setpoint")
+    plot.plot(historian["TIME"], historian["PROCESS_VALUE"], label="Process value")
+    plot.plot(historian["TIME"], historian["OUTPUT"], label="Output")
+    plot.legend()
+    plot.set_title(f'Kp = {pid.kp}, Ki = {pid.ki}, kd = {pid.kd}')
+
+plt.show()
@@ -0,0 +1,51 @@
+import PID_Py.PID as PID
+import PID_Py.Simulation as Sim
+
+import time
+import matplotlib.pyplot as plt
+import numpy as np
+
+timeLenght = 20.0
+cycleTime = 0.001
+
+# Recorded samples (setpoint step on a simulated system)
+timeValue = np.arange(0, timeLenght, cycleTime)
+setpoints = np.where(timeValue >= 1.0, 10.0, 0.0)
+
+system = Sim.Simulation(1.0, 0.1)
+processValues = np.zeros(timeValue.shape[0])
+
+for k in range(1, timeValue.shape[0]):
+    system(np.sin(timeValue[k]) + setpoints[k] / 10.0, timeValue[k])
+    processValues[k] = system.output
+
+print("Start...")
+
+# Same PID evaluated with `computeBatch` and with `compute` sample by sample
+for integralLimit in (None, 5.0):
+    pid = PID.PID(kp = 1.0, ki = 0.5, kd = 0.1, integralLimit = integralLimit, outputLimits = (-20.0, 20.0))
+
+    startTime = time.perf_counter()
+    batchOutputs = pid.computeBatch(setpoints, processValues, timeValue)
+    batchDuration = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+    computeOutputs = np.array([pid(setpoint = sp, processValue = pv, currentTime = t) for sp, pv, t in zip(setpoints, processValues, timeValue)])
+    computeDuration = time.perf_counter() - startTime
+
+    print(f"integralLimit = {integralLimit}: computeBatch {batchDuration * 1000:.1f} ms, compute {computeDuration * 1000:.1f} ms, maximum difference {np.max(np.abs(batchOutputs - computeOutputs))}")
+
+fig, (systemPlot, outputPlot) = plt.subplots(2, sharex=True)
+
+systemPlot.plot(timeValue, setpoints, label="Setpoint")
+systemPlot.plot(timeValue, processValues, label="Process value")
+systemPlot.legend()
+systemPlot.set_title("System")
+
+outputPlot.plot(timeValue, batchOutputs, label="computeBatch")
+outputPlot.plot(timeValue, computeOutputs, "--", label="compute")
+outputPlot.legend()
+outputPlot.set_title("Output")
+outputPlot.set_xlabel("time (s)")
+
+plt.show()
@@ -27,24 +27,27 @@ for t in timeValue:
     
     pid(setpoint = setpoint, currentTime = t)
 
+# Copy of the records, read once
+historian = pid.historian
+
 fig, (systemPlot, pidPlot, outputPlot) = plt.subplots(3, sharex=True)
 
 fig.suptitle(f'Kp = {pid.kp}, Ki = {pid.ki}, kd = {pid.kd}')
 fig.set_size_inches(7, 8)
 
-systemPlot.plot(pid.historian["TIME"], pid.historian["SETPOINT"], label="Setpoint")
-systemPlot.plot(pid.historian["TIME"], pid.historian["PROCESS_VALUE"], label="Process value")
-systemPlot.plot(pid.historian["TIME"], pid.historian["ERROR"], label="Error")
+systemPlot.plot(historian["TIME"], historian["SETPOINT"], label="Setpoint")
+systemPlot.plot(historian["TIME"], historian["PROCESS_VALUE"], label="Process value")
+systemPlot.plot(historian["TIME"], historian["ERROR"], label="Error")
 systemPlot.legend()
 systemPlot.set_title("System")
 
-pidPlot.plot(pid.historian["TIME"], pid.historian["P"], label="P")
-pidPlot.plot(pid.historian["TIME"], pid.historian["I"], label="I")
-pidPlot.plot(pid.historian["TIME"], pid.historian["D"], label="D")
+pidPlot.plot(historian["TIME"], historian["P"], label="P")
+pidPlot.plot(historian["TIME"], historian["I"], label="I")
+pidPlot.plot(historian["TIME"], historian["D"], label="D")
 pidPlot.legend()
 pidPlot.set_title("PID")
 
-outputPlot.plot(pid.historian["TIME"], pid.historian["OUTPUT"], label="Output")
+outputPlot.plot(historian["TIME"], historian["OUTPUT"], label="Output")
 outputPlot.legend()
 outputPlot.set_title("Output")
 outputPlot.set_xlabel("time (s)")
@@ -39,19 +39,22 @@ while time.time() - startTime < timeLenght:
 pid.quit = True
 pid.join()
 
+# Copy of the records, read once
+historian = pid.historian
+
 fig, (systemPlot, pidPlot, outputPlot) = plt.subplots(3, sharex=True)
 
-systemPlot.plot(pid.historian["TIME"], pid.historian["SETPOINT"], label="Setpoint")
-systemPlot.plot(pid.historian["TIME"], pid.historian["PROCESS_VALUE"], label="Process value")
-systemPlot.plot(pid.historian["TIME"], pid.historian["ERROR"], label="Error")
+systemPlot.plot(historian["TIME"], historian["SETPOINT"], label="Setpoint")
+systemPlot.plot(historian["TIME"], historian["PROCESS_VALUE"], label="Process value")
+systemPlot.plot(historian["TIME"], historian["ERROR"], label="Error")
 systemPlot.legend()
 
-pidPlot.plot(pid.historian["TIME"], pid.historian["P"], label="P")
-pidPlot.plot(pid.historian["TIME"], pid.historian["I"], label="I")
-pidPlot.plot(pid.historian["TIME"], pid.historian["D"], label="D")
+pidPlot.plot(historian["TIME"], historian["P"], label="P")
+pidPlot.plot(historian["TIME"], historian["I"], label="I")
+pidPlot.plot(historian["TIME"], historian["D"], label="D")
 pidPlot.legend()
 
-outputPlot.plot(pid.historian["TIME"], pid.historian["OUTPUT"], label="Output")
+outputPlot.plot(historian["TIME"], historian["OUTPUT"], label="Output")
 outputPlot.legend()
 
 plt.show()
\ No newline at end of file